@@ -0,0 +1,61 @@
+import logging
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _silence_logs():
+    """Disable logging for the LLM tests and restore it afterwards."""
+    logging.disable(logging.CRITICAL)
+    yield
+    logging.disable(logging.NOTSET)
+
+
+def _chat_completion():
+    """Build the canned chat completion; it is only read, so plain namespaces are enough."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content="Test response"))],
+        usage=SimpleNamespace(total_tokens=100),
+    )
+
+
+@pytest.fixture(scope="package", autouse=True)
+def _stub_openai():
+    """Stub out the ``openai`` SDK while the tests in ``tests/llm`` run.
+
+    Only the ``openai`` entry of ``sys.modules`` is replaced, and it is restored
+    once the package finishes, so later test directories see the real SDK.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setitem(sys.modules, "openai", MagicMock())
+        yield
+
+
+@pytest.fixture(scope="package")
+def mock_openai_module(_stub_openai):
+    """Wire the package's ``openai`` stub to return a canned chat completion."""
+    mock_openai = sys.modules["openai"]
+    mock_openai.OpenAI.return_value.chat.completions.create.return_value = _chat_completion()
+    return mock_openai
+
+
+@pytest.fixture
+def reset_mock_response(mock_openai_module):
+    """Reset call state on the shared ``openai`` mock and return its completions mock."""
+    mock_completions = mock_openai_module.OpenAI.return_value.chat.completions
+
+    mock_openai_module.reset_mock()
+    mock_completions.create.return_value = _chat_completion()
+    mock_completions.create.side_effect = None
+    return mock_completions
+
+
+@pytest.fixture(autouse=True)
+def isolate_env(monkeypatch):
+    """Unset the provider environment variables consulted by the LLM clients."""
+    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+    monkeypatch.delenv("OPENAI_BASE_URL", raising=False)
+    monkeypatch.delenv("VOLCENGINE_API_KEY", raising=False)
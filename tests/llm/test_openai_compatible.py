@@ -0,0 +1,169 @@
+from typing import NamedTuple, Optional
+
+import pytest
+
+from deepsearcher.llm import OpenAI, Volcengine
+from deepsearcher.llm.base import BaseLLM, ChatResponse
+
+
+class Provider(NamedTuple):
+    cls: type[BaseLLM]
+    default_model: str
+    default_base_url: Optional[str]
+    env_key: str
+    custom_model: str
+    custom_base_url: str
+
+
+PROVIDERS = [
+    pytest.param(
+        Provider(
+            cls=OpenAI,
+            default_model="o1-mini",
+            default_base_url=None,
+            env_key="OPENAI_API_KEY",
+            custom_model="gpt-4",
+            custom_base_url="https://custom.openai.api",
+        ),
+        id="openai",
+    ),
+    pytest.param(
+        Provider(
+            cls=Volcengine,
+            default_model="deepseek-r1-250120",
+            default_base_url="https://ark.cn-beijing.volces.com/api/v3",
+            env_key="VOLCENGINE_API_KEY",
+            custom_model="deepseek-r2-250120",
+            custom_base_url="https://custom.volcengine.api",
+        ),
+        id="volcengine",
+    ),
+]
+
+parametrize_providers = pytest.mark.parametrize("provider", PROVIDERS)
+
+
+@parametrize_providers
+def test_init_default(mock_openai_module, reset_mock_response, provider):
+    """Test initialization with default parameters."""
+    llm = provider.cls()
+    # Check that OpenAI client was initialized correctly
+    mock_openai_module.OpenAI.assert_called_once_with(
+        api_key=None,
+        base_url=provider.default_base_url
+    )
+
+    # Check default model
+    assert llm.model == provider.default_model
+
+
+@parametrize_providers
+def test_init_with_api_key_from_env(mock_openai_module, reset_mock_response, monkeypatch, provider):
+    """Test initialization with API key from environment variable."""
+    api_key = "test_api_key_from_env"
+    monkeypatch.setenv(provider.env_key, api_key)
+    provider.cls()
+    mock_openai_module.OpenAI.assert_called_with(
+        api_key=api_key,
+        base_url=provider.default_base_url
+    )
+
+
+def test_init_with_base_url_from_env(mock_openai_module, reset_mock_response, monkeypatch):
+    """Test that OpenAI reads its base URL from the environment."""
+    base_url = "https://api.openai.com/v1"
+    monkeypatch.setenv("OPENAI_BASE_URL", base_url)
+    OpenAI()
+    mock_openai_module.OpenAI.assert_called_with(
+        api_key=None,
+        base_url=base_url
+    )
+
+
+@parametrize_providers
+def test_init_with_api_key_parameter(mock_openai_module, reset_mock_response, provider):
+    """Test initialization with API key as parameter."""
+    api_key = "test_api_key_param"
+    provider.cls(api_key=api_key)
+    mock_openai_module.OpenAI.assert_called_with(
+        api_key=api_key,
+        base_url=provider.default_base_url
+    )
+
+
+@parametrize_providers
+def test_init_with_custom_model(reset_mock_response, provider):
+    """Test initialization with custom model."""
+    llm = provider.cls(model=provider.custom_model)
+    assert llm.model == provider.custom_model
+
+
+@parametrize_providers
+def test_init_with_custom_base_url(mock_openai_module, reset_mock_response, provider):
+    """Test initialization with custom base URL."""
+    provider.cls(base_url=provider.custom_base_url)
+    mock_openai_module.OpenAI.assert_called_with(
+        api_key=None,
+        base_url=provider.custom_base_url
+    )
+
+
+@parametrize_providers
+def test_chat_single_message(reset_mock_response, provider):
+    """Test chat with a single message."""
+    llm = provider.cls()
+
+    messages = [{"role": "user", "content": "Hello"}]
+    response = llm.chat(messages)
+
+    # Check that completions.create was called correctly
+    reset_mock_response.create.assert_called_once()
+    call_args = reset_mock_response.create.call_args
+    assert call_args[1]["model"] == provider.default_model
+    assert call_args[1]["messages"] == messages
+
+    # Check response
+    assert isinstance(response, ChatResponse)
+    assert response.content == "Test response"
+    assert response.total_tokens == 100
+
+
+@parametrize_providers
+def test_chat_multiple_messages(reset_mock_response, provider):
+    """Test chat with multiple messages."""
+    llm = provider.cls()
+
+    messages = [
+        {"role": "system", "content": "You are a helpful assistant"},
+        {"role": "user", "content": "Hello"},
+        {"role": "assistant", "content": "Hi there!"},
+        {"role": "user", "content": "How are you?"}
+    ]
+    response = llm.chat(messages)
+
+    # Check that completions.create was called correctly
+    reset_mock_response.create.assert_called_once()
+    call_args = reset_mock_response.create.call_args
+    assert call_args[1]["model"] == provider.default_model
+    assert call_args[1]["messages"] == messages
+
+    # Check response
+    assert isinstance(response, ChatResponse)
+    assert response.content == "Test response"
+    assert response.total_tokens == 100
+
+
+@parametrize_providers
+def test_chat_with_error(reset_mock_response, provider):
+    """Test chat when an error occurs."""
+    llm = provider.cls()
+
+    # Mock an error response
+    error_message = f"{provider.cls.__name__} API Error"
+    reset_mock_response.create.side_effect = Exception(error_message)
+
+    messages = [{"role": "user", "content": "Hello"}]
+    with pytest.raises(Exception) as context:
+        llm.chat(messages)
+
+    assert str(context.value) == error_message